@@ -1,29 +1,338 @@
 import sys
 import os
 import zipfile
-import tempfile
+import functools
+import operator
 
 from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QSplitter, QListWidget, QListWidgetItem,
-    QFileDialog, QWidget, QGridLayout, QScrollArea,
+    QApplication, QMainWindow, QSplitter, QListView,
+    QFileDialog, QAbstractScrollArea,
     QPlainTextEdit, QAction, QMessageBox, QToolBar,
     QLabel, QLineEdit, QCheckBox
 )
-from PyQt5.QtGui import QFontDatabase, QFont, QFontMetrics, QIntValidator, QKeySequence, QIcon
-from PyQt5.QtCore import Qt, QStandardPaths
+from PyQt5.QtGui import (
+    QFontDatabase, QFont, QFontMetrics, QIntValidator, QKeySequence, QIcon, QPainter,
+    QStaticText, QTransform
+)
+from PyQt5.QtCore import (
+    Qt, QStandardPaths, QRect, QPointF, QTimer, QObject,
+    QAbstractListModel, QModelIndex, QRunnable, QThreadPool, pyqtSignal
+)
 
-# Subclass QPlainTextEdit so Ctrl+C clears the text box instead of copying
+# Subclass QPlainTextEdit so Ctrl+C clears the text box instead of copying,
+# and so the text is cleared once an edit leaves it overflowing the box
 class ClearableTextEdit(QPlainTextEdit):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # rangeChanged keeps track of overflow without querying the scroll bar
+        # on every keystroke, and counts wrapped lines as well as line breaks.
+        # Only edits act on it, so a taller font keeps the sample text.
+        self._overflowing = False
+        self.verticalScrollBar().rangeChanged.connect(self.on_range_changed)
+        self.document().contentsChanged.connect(self.on_contents_changed)
+
     def keyPressEvent(self, event):
         if event.matches(QKeySequence.Copy):
             self.clear()
         else:
             super().keyPressEvent(event)
 
+    def on_range_changed(self, lo, hi):
+        self._overflowing = hi > 0
+
+    def on_contents_changed(self):
+        # An empty box can still overflow at huge sizes; don't keep clearing it
+        if self._overflowing and not self.document().isEmpty():
+            # Clear once the edit that overflowed has finished
+            QTimer.singleShot(0, self.clear)
+
 # Supported font extensions
 FONT_EXTS = ('.ttf', '.otf')
 ARCHIVE_EXT = '.zip'
+LISTED_EXTS = FONT_EXTS + (ARCHIVE_EXT,)
 ASCII_RANGE = range(32, 127)  # printable ASCII
+EXTENDED_RANGE = range(127, 1025)  # U+007F–U+0400
+# Preview strings indexed by code point, built once rather than on every paint
+CODE_LIMIT = EXTENDED_RANGE.stop  # length of every per-code-point table
+GLYPH_CHARS = tuple(chr(c) for c in range(CODE_LIMIT))
+GLYPH_LABELS = tuple(f"{ch} ({c})" for c, ch in enumerate(GLYPH_CHARS))
+ZIP_CACHE_MAX = 1000  # zip scan results kept across folder loads
+ZIP_CACHE_EVICT = 100
+FM_CACHE_MAX = 32  # QFontMetrics kept by the glyph view
+RENDER_DELAY_MS = 50  # debounce for toolbar-driven re-renders
+
+def first_font_member(z):
+    # Stops at the first font instead of building the whole name list
+    return next((zi for zi in z.infolist() if zi.filename.lower().endswith(FONT_EXTS)), None)
+
+def zip_has_fonts(path, cache):
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size)
+    has = cache.get(key)
+    if has is None:
+        with zipfile.ZipFile(path) as z:
+            has = first_font_member(z) is not None
+        if len(cache) > ZIP_CACHE_MAX:
+            # Drop the oldest entries (dicts keep insertion order)
+            for k in list(cache)[:ZIP_CACHE_EVICT]:
+                cache.pop(k, None)
+        cache[key] = has
+    return has
+
+class FolderScanSignals(QObject):
+    scanned = pyqtSignal(int, list)
+
+# Lists a folder off the GUI thread and emits [(filename, full path), ...]
+class FolderScanner(QRunnable):
+    def __init__(self, folder, token, is_current):
+        super().__init__()
+        self.folder = folder
+        self.token = token
+        self.is_current = is_current
+        self.signals = FolderScanSignals()
+
+    def run(self):
+        # Lowercase each name once and sort on that (decorate-sort-undecorate)
+        with os.scandir(self.folder) as it:
+            pairs = [(low, e) for e in it
+                     for low in (e.name.lower(),)
+                     if low.endswith(LISTED_EXTS) and e.is_file()]
+        if not self.is_current(self.token):
+            return
+        pairs.sort(key=operator.itemgetter(0))
+        self.signals.scanned.emit(self.token, [(e.name, e.path) for _, e in pairs])
+
+class ZipInspectSignals(QObject):
+    inspected = pyqtSignal(int, int, str)
+
+# Works out a zip's tooltip off the GUI thread and emits (generation, row, tooltip)
+class ZipInspector(QRunnable):
+    def __init__(self, path, generation, row, zip_cache):
+        super().__init__()
+        self.path = path
+        self.generation = generation
+        self.row = row
+        self.zip_cache = zip_cache
+        self.signals = ZipInspectSignals()
+
+    def run(self):
+        try:
+            tip = self.path if zip_has_fonts(self.path, self.zip_cache) else "no fonts in here"
+        except zipfile.BadZipFile:
+            tip = "invalid zip"
+        except OSError:
+            # Renamed, deleted or locked since the folder was listed
+            tip = "unreadable zip"
+        self.signals.inspected.emit(self.generation, self.row, tip)
+
+# List model for the font folder; zip tooltips default to the path until inspected
+class FontFileModel(QAbstractListModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # (path, mtime_ns, size) -> whether the zip holds any fonts; kept across folders
+        self.zip_cache: dict[tuple[str, int, int], bool] = {}
+        self._rows: list[tuple[str, str]] = []
+        self._tips: dict[int, str] = {}
+        self._inspecting: set[int] = set()
+        self._generation = 0
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self._rows = rows
+        self._tips = {}
+        self._inspecting = set()
+        self._generation += 1
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        name, full = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return name
+        if role == Qt.ToolTipRole:
+            return self._tips.get(index.row(), full)
+        return None
+
+    def inspect(self, index):
+        row = index.row()
+        if row in self._tips or row in self._inspecting:
+            return
+        name, full = self._rows[row]
+        if not name.lower().endswith(ARCHIVE_EXT):
+            return
+        self._inspecting.add(row)
+        job = ZipInspector(full, self._generation, row, self.zip_cache)
+        job.signals.inspected.connect(self._on_inspected)
+        QThreadPool.globalInstance().start(job)
+
+    def _on_inspected(self, generation, row, tip):
+        if generation != self._generation:
+            return
+        self._inspecting.discard(row)
+        self._tips[row] = tip
+        idx = self.index(row)
+        self.dataChanged.emit(idx, idx, [Qt.ToolTipRole])
+
+# Shared, already-resolved QFont per style; callers must not mutate the result.
+# Preview cells hold a single glyph, so shaping and kerning buy nothing there;
+# merging is only worth keeping where a fallback font should fill the gaps.
+@functools.lru_cache(maxsize=64)
+def styled_font(family, size, bold, italic, merge=True):
+    f = QFont(family, size)
+    f.setBold(bold)
+    f.setItalic(italic)
+    strategy = QFont.PreferMatch | QFont.PreferNoShaping
+    if not merge:
+        strategy |= QFont.NoFontMerging
+    f.setStyleStrategy(strategy)
+    f.setKerning(False)
+    return f
+
+# Preview grid rows: tuples of code points, None marks the "Other Unicode" separator
+def build_preview_rows(cols):
+    rows = [ASCII_RANGE[i:i+cols] for i in range(0, len(ASCII_RANGE), cols)]
+    rows.append(None)
+    rows += [EXTENDED_RANGE[i:i+cols] for i in range(0, len(EXTENDED_RANGE), cols)]
+    return rows
+
+# Glyph preview that only paints the rows currently scrolled into view
+class GlyphGridView(QAbstractScrollArea):
+    PAD = 4
+
+    def __init__(self, cols=10, parent=None):
+        super().__init__(parent)
+        self.cols = cols
+        self.rows = build_preview_rows(cols)
+        self.font_ = None
+        self.ref_font = None
+        self.supported = bytes(CODE_LIMIT)
+        self.cell_h = self.ref_h = self.gly_h = 1
+        # Natural width of each column, sized to its own content like QGridLayout did
+        self.col_w = [1] * cols
+        self._ref_col_w = [0] * cols
+        self._fm_cache: dict[str, QFontMetrics] = {}
+        # Pooled text layouts per code point; only re-prepared when their font changes
+        self._ref_texts = [None] * CODE_LIMIT
+        self._gly_texts = [None] * CODE_LIMIT
+        self._ref_ready = bytearray(CODE_LIMIT)
+        self._gly_ready = bytearray(CODE_LIMIT)
+
+    def metrics(self, font):
+        # Re-renders with an unchanged font reuse the metrics from last time
+        k = font.toString()
+        fm = self._fm_cache.get(k)
+        if fm is None:
+            if len(self._fm_cache) >= FM_CACHE_MAX:
+                del self._fm_cache[next(iter(self._fm_cache))]
+            fm = self._fm_cache[k] = QFontMetrics(font)
+        return fm
+
+    def set_fonts(self, font, ref_font, supported):
+        if self.font_ is None or font.toString() != self.font_.toString():
+            self._gly_ready = bytearray(CODE_LIMIT)
+        ref_changed = self.ref_font is None or ref_font.toString() != self.ref_font.toString()
+        if ref_changed:
+            self._ref_ready = bytearray(CODE_LIMIT)
+        self.font_ = QFont(font)
+        self.ref_font = QFont(ref_font)
+        self.supported = supported
+        fm = self.metrics(self.font_)
+        ref_fm = self.metrics(self.ref_font)
+        if ref_changed:
+            self._ref_col_w = self.column_widths(
+                lambda code: ref_fm.horizontalAdvance(GLYPH_LABELS[code]))
+        gly_col_w = self.column_widths(
+            lambda code: fm.horizontalAdvance(GLYPH_CHARS[code]) if supported[code] else 0)
+        self.col_w = [max(a, b) + 2 * self.PAD for a, b in zip(self._ref_col_w, gly_col_w)]
+        self.ref_h = ref_fm.height()
+        self.gly_h = fm.height()
+        self.cell_h = self.ref_h + self.gly_h + 2 * self.PAD
+        self.update_ranges()
+        self.viewport().update()
+
+    def column_widths(self, advance):
+        widths = [0] * self.cols
+        for codes in self.rows:
+            if codes is not None:
+                for c, code in enumerate(codes):
+                    widths[c] = max(widths[c], advance(code))
+        return widths
+
+    def column_lefts(self, vp_width):
+        # Spread spare width evenly across the columns, like the old grid layout did
+        extra = max(0, vp_width - sum(self.col_w)) / self.cols
+        lefts, x = [], 0.0
+        for w in self.col_w:
+            lefts.append(x)
+            x += w + extra
+        return lefts, extra
+
+    def static_text(self, pool, ready, code, text, font):
+        st = pool[code]
+        if st is None:
+            st = pool[code] = QStaticText(text)
+            st.setTextFormat(Qt.PlainText)
+        if not ready[code]:
+            st.prepare(QTransform(), font)
+            ready[code] = 1
+        return st
+
+    def update_ranges(self):
+        vp = self.viewport()
+        total_w = sum(self.col_w)
+        total_h = len(self.rows) * self.cell_h
+        self.horizontalScrollBar().setRange(0, max(0, total_w - vp.width()))
+        self.horizontalScrollBar().setPageStep(vp.width())
+        self.horizontalScrollBar().setSingleStep(max(self.col_w))
+        self.verticalScrollBar().setRange(0, max(0, total_h - vp.height()))
+        self.verticalScrollBar().setPageStep(vp.height())
+        self.verticalScrollBar().setSingleStep(self.cell_h)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.update_ranges()
+
+    def paintEvent(self, event):
+        vp = self.viewport()
+        p = QPainter(vp)
+        p.fillRect(event.rect(), Qt.white)
+        if self.font_ is None:
+            return
+        lefts, extra = self.column_lefts(vp.width())
+        widths = [w + extra for w in self.col_w]
+        dx = self.horizontalScrollBar().value()
+        dy = self.verticalScrollBar().value()
+        first_row = dy // self.cell_h
+        last_row = min(len(self.rows), first_row + vp.height() // self.cell_h + 2)
+        for r in range(first_row, last_row):
+            y = r * self.cell_h - dy
+            codes = self.rows[r]
+            if codes is None:
+                p.setFont(QApplication.font())
+                p.drawText(QRect(-dx, y, int(sum(widths)), self.cell_h),
+                           Qt.AlignCenter, "Other Unicode")
+                continue
+            # Reference text with code, bottom-aligned in the upper half of the cell
+            p.setFont(self.ref_font)
+            bottom = y + self.PAD + self.ref_h
+            for c, code in enumerate(codes):
+                st = self.static_text(self._ref_texts, self._ref_ready, code,
+                                      GLYPH_LABELS[code], self.ref_font)
+                size = st.size()
+                p.drawStaticText(QPointF(lefts[c] - dx + (widths[c] - size.width()) / 2,
+                                         bottom - size.height()), st)
+            # Font glyph only if supported, top-aligned below it
+            p.setFont(self.font_)
+            for c, code in enumerate(codes):
+                if self.supported[code]:
+                    st = self.static_text(self._gly_texts, self._gly_ready, code,
+                                          GLYPH_CHARS[code], self.font_)
+                    p.drawStaticText(QPointF(lefts[c] - dx + (widths[c] - st.size().width()) / 2,
+                                             bottom), st)
 
 class FontPreviewer(QMainWindow):
     def __init__(self):
@@ -74,8 +383,13 @@ class FontPreviewer(QMainWindow):
         # Splitters
         outer = QSplitter(Qt.Horizontal)
         self.setCentralWidget(outer)
-        self.fileList = QListWidget()
-        self.fileList.itemClicked.connect(self.on_file_clicked)
+        self.fileModel = FontFileModel(self)
+        self.fileList = QListView()
+        self.fileList.setModel(self.fileModel)
+        self.fileList.clicked.connect(self.on_file_clicked)
+        # Zips are only opened once the pointer reaches them
+        self.fileList.setMouseTracking(True)
+        self.fileList.entered.connect(self.fileModel.inspect)
         outer.addWidget(self.fileList)
 
         rightSplit = QSplitter(Qt.Vertical)
@@ -83,19 +397,13 @@ class FontPreviewer(QMainWindow):
         outer.setStretchFactor(1, 3)
 
         # Preview area
-        self.previewWidget = QWidget()
-        self.previewWidget.setStyleSheet("background-color:white;")
-        self.previewLayout = QGridLayout(self.previewWidget)
-        self.previewScroll = QScrollArea()
-        self.previewScroll.setStyleSheet("background-color:white;")
-        self.previewScroll.setWidgetResizable(True)
-        self.previewScroll.setWidget(self.previewWidget)
-        rightSplit.addWidget(self.previewScroll)
+        self.glyphView = GlyphGridView()
+        self.glyphView.setStyleSheet("background-color:white;")
+        rightSplit.addWidget(self.glyphView)
 
         # Text entry
         self.textEdit = ClearableTextEdit()
         self.textEdit.setPlaceholderText("Type here…")
-        self.textEdit.textChanged.connect(self.on_text_changed)
         rightSplit.addWidget(self.textEdit)
 
         rightSplit.setStretchFactor(0, 1)
@@ -109,6 +417,12 @@ class FontPreviewer(QMainWindow):
 
         self.currentFont = QApplication.font()
         self.currentFontSize = 44
+        self.update_coverage()
+        self._render_pending = False
+        # (path, mtime_ns, size) -> application font id of fonts loaded from disk
+        self._font_ids: dict[tuple[str, int, int], int] = {}
+
+        self._scan_token = 0
 
         self.load_folder(self.currentFolder)
         self.textEdit.setFocus()
@@ -127,147 +441,125 @@ class FontPreviewer(QMainWindow):
 
     def load_folder(self, folder):
         self.currentFolder = folder
-        self.fileList.clear()
-        for fn in sorted(os.listdir(folder), key=str.lower):
-            if fn.lower().endswith(FONT_EXTS) or fn.lower().endswith(ARCHIVE_EXT):
-                item = QListWidgetItem(fn)
-                full = os.path.join(folder, fn)
-                if fn.lower().endswith(ARCHIVE_EXT):
-                    try:
-                        with zipfile.ZipFile(full) as z:
-                            has = any(n.lower().endswith(FONT_EXTS) for n in z.namelist())
-                        item.setToolTip(full if has else "no fonts in here")
-                    except zipfile.BadZipFile:
-                        item.setToolTip("invalid zip")
-                else:
-                    item.setToolTip(full)
-                self.fileList.addItem(item)
-
-    def on_file_clicked(self, item):
-        path = os.path.join(self.currentFolder, item.text())
+        self.fileModel.set_rows([])
+        # Bumping the token makes any scan still in flight give up
+        self._scan_token += 1
+        scanner = FolderScanner(folder, self._scan_token,
+                                lambda t: t == self._scan_token)
+        scanner.signals.scanned.connect(self._populate_file_list)
+        QThreadPool.globalInstance().start(scanner)
+
+    def _populate_file_list(self, token, rows):
+        if token != self._scan_token:
+            return
+        self.fileModel.set_rows(rows)
+
+    def on_file_clicked(self, index):
+        path = os.path.join(self.currentFolder, index.data())
         if path.lower().endswith(ARCHIVE_EXT):
             try:
                 with zipfile.ZipFile(path) as z:
-                    fonts = [n for n in z.namelist() if n.lower().endswith(FONT_EXTS)]
-                    if not fonts:
+                    member = first_font_member(z)
+                    if member is None:
                         QMessageBox.information(self, "No Fonts", "no fonts in here")
                         return
-                    data = z.read(fonts[0])
+                    data = z.read(member)
             except zipfile.BadZipFile:
                 QMessageBox.warning(self, "Error", "Invalid ZIP archive")
                 return
-            tmp = tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(fonts[0])[1])
-            tmp.write(data); tmp.close()
-            path = tmp.name
-        self.load_font(path)
+            except OSError:
+                QMessageBox.warning(self, "Error", "Failed to load font.")
+                return
+            self.load_font_from_bytes(data)
+        else:
+            self.load_font(path)
 
     def load_font(self, path):
-        # Clear preview
-        while self.previewLayout.count():
-            w = self.previewLayout.takeAt(0).widget()
-            if w: w.deleteLater()
-        fid = QFontDatabase.addApplicationFont(path)
+        # Re-clicking an unchanged file reuses its registration instead of adding it again
+        try:
+            st = os.stat(path)
+            key = (path, st.st_mtime_ns, st.st_size)
+            fid = self._font_ids.get(key)
+            if fid is None:
+                with open(path, 'rb') as f:
+                    data = f.read()
+        except OSError:
+            # The listing is never refreshed, so the file may have gone since
+            QMessageBox.warning(self, "Error", "Failed to load font."); return
+        if fid is None:
+            fid = QFontDatabase.addApplicationFontFromData(data)
+            if fid >= 0:
+                self._font_ids[key] = fid
+        self.apply_font(fid)
+
+    def load_font_from_bytes(self, data):
+        self.apply_font(QFontDatabase.addApplicationFontFromData(data))
+
+    def apply_font(self, fid):
         if fid < 0:
             QMessageBox.warning(self, "Error", "Failed to load font."); return
         fams = QFontDatabase.applicationFontFamilies(fid)
         if not fams:
             QMessageBox.warning(self, "Error", "No font family found."); return
         self.currentFont = QFont(fams[0], self.currentFontSize)
+        self.update_coverage()
         self.apply_style_flags()
         self.render_preview()
         self.textEdit.setFont(self.currentFont)
         self.textEdit.setFocus()
 
+    def update_coverage(self):
+        # Glyph coverage only changes with the font itself, not its size or style.
+        # Ask without merging, as the preview draws with, so fallback fonts don't count.
+        f = QFont(self.currentFont)
+        f.setStyleStrategy(QFont.NoFontMerging)
+        fm = QFontMetrics(f)
+        self._supported = bytes(1 if fm.inFontUcs4(c) else 0 for c in range(CODE_LIMIT))
+
     def insert_alt_code_symbol(self):
+        # Parse with the validator's locale: it lets group separators such as "1,000" through
         code = self.altCodeEdit.text()
         if code:
-            try:
-                ch = chr(int(code))
-                self.textEdit.insertPlainText(ch)
-            except:
+            value, ok = self.altCodeEdit.validator().locale().toInt(code)
+            if ok and 0 <= value <= 0x10FFFF:
+                self.textEdit.insertPlainText(chr(value))
+            else:
                 QMessageBox.warning(self, "Invalid Code", f"Invalid alt code: {code}")
 
     def render_preview(self):
-        # Clear any existing widgets
-        while self.previewLayout.count():
-            w = self.previewLayout.takeAt(0).widget()
-            if w:
-                w.deleteLater()
-
-        fm = QFontMetrics(self.currentFont)
-        default_font = QApplication.font()
-        ref_font = QFont(default_font.family(), 14)
-        cols = 10
-
-        # 1) Core ASCII characters
-        for idx, code in enumerate(ASCII_RANGE):
-            ch = chr(code)
-            r = (idx // cols) * 2
-            c = idx % cols
-
-            # Reference label with code
-            lbl_ref = QLabel(f"{ch} ({code})")
-            lbl_ref.setFont(ref_font)
-            self.previewLayout.addWidget(
-                lbl_ref, r, c, 1, 1, Qt.AlignBottom | Qt.AlignHCenter
-            )
-
-            # Font glyph only if supported
-            if fm.inFontUcs4(code):
-                lbl_gly = QLabel(ch)
-                lbl_gly.setFont(self.currentFont)
-            else:
-                lbl_gly = QLabel("")
-            self.previewLayout.addWidget(
-                lbl_gly, r+1, c, 1, 1, Qt.AlignTop | Qt.AlignHCenter
-            )
-
-        # 2) “Other Unicode” separator
-        sep_row = ((len(ASCII_RANGE) + cols - 1) // cols) * 2
-        sep = QLabel("Other Unicode")
-        sep.setAlignment(Qt.AlignCenter)
-        self.previewLayout.addWidget(sep, sep_row, 0, 1, cols)
-
-        # 3) Extended block U+007F–U+0400 (127–1024)
-        for j, code in enumerate(range(127, 1025)):
-            ch = chr(code)
-            r = sep_row + 1 + (j // cols) * 2
-            c = j % cols
-
-            lbl_ref_o = QLabel(f"{ch} ({code})")
-            lbl_ref_o.setFont(ref_font)
-            self.previewLayout.addWidget(
-                lbl_ref_o, r, c, 1, 1, Qt.AlignBottom | Qt.AlignHCenter
-            )
-
-            if fm.inFontUcs4(code):
-                lbl_gly_o = QLabel(ch)
-                lbl_gly_o.setFont(self.currentFont)
-            else:
-                lbl_gly_o = QLabel("")
-            self.previewLayout.addWidget(
-                lbl_gly_o, r+1, c, 1, 1, Qt.AlignTop | Qt.AlignHCenter
-            )
+        ref_font = styled_font(QApplication.font().family(), 14, False, False)
+        # Only glyphs the font has are drawn, so fallback lookups can be skipped
+        font = styled_font(self.currentFont.family(), self.currentFontSize,
+                           self.currentFont.bold(), self.currentFont.italic(), merge=False)
+        self.glyphView.set_fonts(font, ref_font, self._supported)
 
     def update_font_settings(self):
-        try:
-            sz = int(self.sizeEdit.text())
-            if sz > 0: self.currentFontSize = sz
-        except:
-            pass
-        self.apply_style_flags()
-        self.currentFont.setPointSize(self.currentFontSize)
-        self.render_preview()
+        # Intermediate text such as "4,6" may still be in the box when a checkbox is toggled
+        sz, ok = self.sizeEdit.validator().locale().toInt(self.sizeEdit.text())
+        if ok and sz > 0: self.currentFontSize = sz
+        # Build the target font in one go rather than mutating it setter by setter
+        f = QFont(self.currentFont.family(), self.currentFontSize)
+        f.setBold(self.boldCheck.isChecked())
+        f.setItalic(self.italicCheck.isChecked())
+        self.currentFont = f
+        self.schedule_render()
         self.textEdit.setFont(self.currentFont)
 
+    def schedule_render(self):
+        # Coalesce bursts of toolbar edits into a single re-render
+        if not self._render_pending:
+            self._render_pending = True
+            QTimer.singleShot(RENDER_DELAY_MS, self._do_render_if_pending)
+
+    def _do_render_if_pending(self):
+        if self._render_pending:
+            self._render_pending = False
+            self.render_preview()
+
     def apply_style_flags(self):
         self.currentFont.setBold(self.boldCheck.isChecked())
         self.currentFont.setItalic(self.italicCheck.isChecked())
 
-    def on_text_changed(self):
-        if self.textEdit.verticalScrollBar().maximum() > 0:
-            self.textEdit.clear()
-
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     win = FontPreviewer()